@@ -9,16 +9,14 @@ import sys
 import time
 import argparse
 import schedule
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import pytz
 
-# Add the parent directory to the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Make the package importable when running this script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.logging import setup_logger
-from scrapers.labour_dept import LabourDeptScraper
-from scrapers.jobsdb import JobsDBScraper
-from scrapers.hktdc import HKTDCScraper
+from hk_job_fair_aggregator.utils.logging import setup_logger
 
 # Set up logger
 logger = setup_logger('hk_job_fair_aggregator')
@@ -27,15 +25,28 @@ def run_primary_scrapers():
     """Run scrapers for primary sources."""
     logger.info("Running primary scrapers")
     
+    # Imported here so runs that never reach the primary sources skip
+    # loading the scraper stacks (lxml, bs4, the HTTP cache client)
+    from hk_job_fair_aggregator.scrapers.labour_dept import LabourDeptScraper
+    from hk_job_fair_aggregator.scrapers.jobsdb import JobsDBScraper
+    from hk_job_fair_aggregator.scrapers.hktdc import HKTDCScraper
+    
     # Initialize scrapers
-    labour_dept_scraper = LabourDeptScraper()
-    jobsdb_scraper = JobsDBScraper()
-    hktdc_scraper = HKTDCScraper()
+    scrapers = {
+        'labour_dept': LabourDeptScraper(),
+        'jobsdb': JobsDBScraper(),
+        'hktdc': HKTDCScraper(),
+    }
     
-    # Run scrapers
-    labour_dept_scraper.run()
-    jobsdb_scraper.run()
-    hktdc_scraper.run()
+    # The sources are independent hosts, so run the scrapers in
+    # parallel; one failing or stalling doesn't hold up the others
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {executor.submit(scraper.run): name for name, scraper in scrapers.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"{futures[future]} scraper failed: {e}", exc_info=True)
     
     logger.info("Primary scrapers completed")
 
@@ -102,11 +113,18 @@ def main():
     else:
         run_all_scrapers()
     
-    # Run the scheduler
+    # Run the scheduler, sleeping until the next job is due instead of
+    # polling every minute; the one-hour cap keeps the loop responsive
+    # if jobs are ever added at runtime
     logger.info("Starting scheduler")
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            logger.info("No jobs scheduled, exiting scheduler")
+            break
+        if idle > 0:
+            time.sleep(min(idle, 3600))
         schedule.run_pending()
-        time.sleep(60)
 
 if __name__ == '__main__':
     try:
@@ -4,19 +4,19 @@ Provides common functionality for all scrapers.
 """
 
 import os
-import json
-import requests
+import pickle
+import threading
+import orjson
+import hishel
+import httpx
+import lxml.html
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.logging import setup_logger, with_retry
-from utils.normalizer import (
+from ..utils.logging import setup_logger, with_retry, async_retrying
+from ..utils.normalizer import (
     normalize_date, 
     normalize_datetime, 
     normalize_venue_name,
@@ -26,9 +26,13 @@ from utils.normalizer import (
     extract_contact_info,
     clean_html,
     generate_event_id,
+    build_event_index,
+    build_event_buckets,
     is_duplicate_event
 )
 
+HKT = ZoneInfo('Asia/Hong_Kong')
+
 class BaseScraper(ABC):
     """
     Base class for all scrapers.
@@ -64,17 +68,36 @@ class BaseScraper(ABC):
         self.source_priority = source_priority
         self.check_frequency = check_frequency
         self.language = language
-        self.logger = setup_logger(f"scraper.{name.lower().replace(' ', '_')}")
+        self.source_prefix = name.lower().replace(' ', '_')
+        self.logger = setup_logger(f"scraper.{self.source_prefix}")
         
         # Create data directory if it doesn't exist
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
         os.makedirs(self.data_dir, exist_ok=True)
+
+        # Cache for load_existing_data, invalidated on data-file changes
+        self._existing_cache = None
+        self._existing_cache_mtime = 0
         
         # User agent for requests
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept-Language': 'zh-HK,zh;q=0.9,en-US;q=0.8,en;q=0.7',
         }
+
+        # Long-lived HTTP client so repeated fetches to the same host reuse
+        # one TCP+TLS connection (HTTP/2 multiplexes them on a single socket).
+        # Responses are cached on disk, so unchanged pages revalidate with a
+        # conditional request instead of transferring the full body again.
+        self.http_cache_dir = os.path.join(self.data_dir, '.http_cache')
+        self._session = hishel.CacheClient(
+            storage=hishel.FileStorage(base_path=self.http_cache_dir),
+            http2=True,
+            headers=self.headers,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            follow_redirects=True
+        )
     
     @with_retry(max_attempts=3, min_wait=2, max_wait=10)
     def get_page(self, url, params=None):
@@ -86,24 +109,71 @@ class BaseScraper(ABC):
             params (dict, optional): Query parameters
             
         Returns:
-            requests.Response: Response object
+            httpx.Response: Response object
         """
         self.logger.info(f"Fetching page: {url}")
-        response = requests.get(url, headers=self.headers, params=params, timeout=30)
+        response = self._session.get(url, params=params)
         response.raise_for_status()
         return response
-    
-    def parse_html(self, html):
+
+    def close(self):
+        """Release the pooled HTTP connections."""
+        self._session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    async def get_page_async(self, session, url, params=None):
+        """
+        Get a page from the source asynchronously.
+
+        Args:
+            session (httpx.AsyncClient): Shared HTTP session
+            url (str): URL to fetch
+            params (dict, optional): Query parameters
+
+        Returns:
+            str: Response body text
+        """
+        async for attempt in async_retrying(max_attempts=3, min_wait=2, max_wait=10):
+            with attempt:
+                self.logger.info(f"Fetching page: {url}")
+                response = await session.get(url, params=params)
+                response.raise_for_status()
+                return response.text
+
+    # lxml parsers are reusable but not thread-safe, so keep one per thread
+    _local = threading.local()
+
+    def lxml_parser(self):
+        """
+        Get a reusable lxml HTML parser for the current thread.
+
+        Returns:
+            lxml.html.HTMLParser: Recovering HTML parser
+        """
+        parser = getattr(self._local, 'html_parser', None)
+        if parser is None:
+            parser = lxml.html.HTMLParser(recover=True)
+            self._local.html_parser = parser
+        return parser
+
+    def parse_html(self, html, parse_only=None):
         """
         Parse HTML content.
-        
+
         Args:
             html (str): HTML content
-            
+            parse_only (SoupStrainer, optional): Restrict the parse to
+                matching elements so the rest of the document is skipped
+
         Returns:
             BeautifulSoup: BeautifulSoup object
         """
-        return BeautifulSoup(html, 'lxml')
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
     
     def save_to_json(self, data, filename=None):
         """
@@ -117,45 +187,172 @@ class BaseScraper(ABC):
             str: Path to the saved file
         """
         if not filename:
-            today = datetime.now(pytz.timezone('Asia/Hong_Kong')).strftime('%Y-%m-%d')
-            filename = f"{self.name.lower().replace(' ', '_')}_{today}.json"
+            today = datetime.now(HKT).strftime('%Y-%m-%d')
+            filename = f"{self.source_prefix}_{today}.json"
         
         file_path = os.path.join(self.data_dir, filename)
         
-        # Add source metadata to each event
+        # Add source metadata to each event; the fields are identical for
+        # the whole batch, so build them once and merge per event
+        metadata = self.source_metadata()
+        data = [event | metadata for event in data]
+
+        # Collect IDs before writing, then drop the memoized '_event_id'
+        # key: it is an in-process cache, not part of the record
+        new_ids = [generate_event_id(event) for event in data]
         for event in data:
-            event['source_id'] = self.source_id
-            event['source_name'] = self.name
-            event['source_type'] = self.source_type
-            event['source_priority'] = self.source_priority
-            event['scraped_at'] = datetime.now(pytz.timezone('Asia/Hong_Kong')).isoformat()
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
+            event.pop('_event_id', None)
+
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+        # Update the ID index so future runs can deduplicate without
+        # re-reading every historical data file
+        known_ids = self.load_existing_ids()
+        known_ids.update(new_ids)
+        with open(self.index_path, 'wb') as f:
+            f.write(orjson.dumps(sorted(known_ids)))
+
         self.logger.info(f"Saved {len(data)} events to {file_path}")
         return file_path
-    
+
+    def save_to_ndjson(self, data, filename=None):
+        """
+        Save data to a newline-delimited JSON file, one event per line.
+
+        Events are serialized and written incrementally, so peak memory
+        stays constant in the number of events; load_existing_data reads
+        these files back line by line.
+
+        Args:
+            data (iterable): Iterable of event data dictionaries
+            filename (str, optional): Custom filename
+
+        Returns:
+            str: Path to the saved file
+        """
+        if not filename:
+            today = datetime.now(HKT).strftime('%Y-%m-%d')
+            filename = f"{self.source_prefix}_{today}.ndjson"
+
+        file_path = os.path.join(self.data_dir, filename)
+
+        metadata = self.source_metadata()
+        new_ids = []
+        with open(file_path, 'wb') as f:
+            for event in data:
+                event = event | metadata
+                new_ids.append(generate_event_id(event))
+                event.pop('_event_id', None)
+                f.write(orjson.dumps(event))
+                f.write(b'\n')
+
+        # Update the ID index so future runs can deduplicate without
+        # re-reading every historical data file
+        known_ids = self.load_existing_ids()
+        known_ids.update(new_ids)
+        with open(self.index_path, 'wb') as f:
+            f.write(orjson.dumps(sorted(known_ids)))
+
+        self.logger.info(f"Saved {len(new_ids)} events to {file_path}")
+        return file_path
+
+    def source_metadata(self):
+        """
+        Build the source metadata fields shared by every event in a batch.
+
+        Returns:
+            dict: Metadata merged into each saved event
+        """
+        return {
+            'source_id': self.source_id,
+            'source_name': self.name,
+            'source_type': self.source_type,
+            'source_priority': self.source_priority,
+            'scraped_at': datetime.now(HKT).isoformat(),
+        }
+
+    @property
+    def index_path(self):
+        """str: Path to the event ID index file for this source."""
+        return os.path.join(self.data_dir, f"{self.source_prefix}_index.json")
+
+    def load_existing_ids(self):
+        """
+        Load the set of known event IDs for deduplication.
+
+        The index is a flat JSON list of event IDs maintained by
+        save_to_json; it is rebuilt from the historical data files if
+        missing or unreadable.
+
+        Returns:
+            set: Set of event ID strings
+        """
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'rb') as f:
+                    return set(orjson.loads(f.read()))
+            except (orjson.JSONDecodeError, OSError) as e:
+                self.logger.error(f"Error loading {self.index_path}: {e}")
+
+        # No usable index yet - rebuild it from the historical data files
+        return {generate_event_id(event) for event in self.load_existing_data()}
+
     def load_existing_data(self):
         """
         Load existing data for deduplication.
-        
+
+        The parsed result is cached in memory (and pickled to disk for
+        cold starts) keyed on the newest data-file mtime, so repeated
+        runs only re-read the JSON files when something changed.
+
         Returns:
             list: List of existing events
         """
+        # Get all data files for this source
+        data_files = [
+            os.path.join(self.data_dir, filename)
+            for filename in os.listdir(self.data_dir)
+            if filename.startswith(self.source_prefix) and filename.endswith(('.json', '.ndjson')) and filename != os.path.basename(self.index_path)
+        ]
+        latest_mtime = max((os.path.getmtime(p) for p in data_files), default=0)
+
+        # In-memory cache for repeated calls within one process
+        if self._existing_cache is not None and self._existing_cache_mtime == latest_mtime:
+            return self._existing_cache
+
+        # On-disk cache for cold starts across processes
+        cache_path = os.path.join(self.data_dir, f".{self.source_prefix}_existing.pkl")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached_mtime, events = pickle.load(f)
+                if cached_mtime == latest_mtime:
+                    self._existing_cache = events
+                    self._existing_cache_mtime = latest_mtime
+                    return events
+            except (pickle.PickleError, EOFError, OSError) as e:
+                self.logger.error(f"Error loading {cache_path}: {e}")
+
         existing_events = []
-        
-        # Get all JSON files for this source
-        for filename in os.listdir(self.data_dir):
-            if filename.startswith(self.name.lower().replace(' ', '_')) and filename.endswith('.json'):
-                file_path = os.path.join(self.data_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        events = json.load(f)
-                        existing_events.extend(events)
-                except (json.JSONDecodeError, FileNotFoundError) as e:
-                    self.logger.error(f"Error loading {file_path}: {e}")
-        
+        for file_path in data_files:
+            try:
+                with open(file_path, 'rb') as f:
+                    if file_path.endswith('.ndjson'):
+                        existing_events.extend(orjson.loads(line) for line in f if line.strip())
+                    else:
+                        existing_events.extend(orjson.loads(f.read()))
+            except (orjson.JSONDecodeError, FileNotFoundError) as e:
+                self.logger.error(f"Error loading {file_path}: {e}")
+
+        self._existing_cache = existing_events
+        self._existing_cache_mtime = latest_mtime
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump((latest_mtime, existing_events), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            self.logger.error(f"Error writing {cache_path}: {e}")
+
         return existing_events
     
     def deduplicate_events(self, new_events):
@@ -168,17 +365,34 @@ class BaseScraper(ABC):
         Returns:
             tuple: (deduplicated_events, duplicate_count)
         """
-        existing_events = self.load_existing_data()
+        existing_ids = self.load_existing_ids()
+        existing_index = None  # built lazily, only if a fuzzy check is needed
+        existing_buckets = None
         deduplicated_events = []
         duplicate_count = 0
-        
+
         for event in new_events:
-            is_duplicate, matching_event = is_duplicate_event(event, existing_events)
-            if not is_duplicate:
-                deduplicated_events.append(event)
-            else:
+            # Fast path: exact ID membership in the index
+            event_id = generate_event_id(event)
+            if event_id in existing_ids:
                 duplicate_count += 1
                 self.logger.debug(f"Duplicate event found: {event.get('event_name')}")
+                continue
+
+            # Events without a source-assigned ID can reappear with slightly
+            # different names or dates, so fall back to the fuzzy matcher
+            if not event.get('source_event_id'):
+                if existing_index is None:
+                    existing_index = build_event_index(self.load_existing_data())
+                    existing_buckets = build_event_buckets(existing_index)
+                is_duplicate, matching_event = is_duplicate_event(event, existing_index, existing_buckets)
+                if is_duplicate:
+                    duplicate_count += 1
+                    self.logger.debug(f"Fuzzy duplicate event found: {event.get('event_name')}")
+                    continue
+
+            deduplicated_events.append(event)
+            existing_ids.add(event_id)
         
         self.logger.info(f"Deduplicated {duplicate_count} events")
         return deduplicated_events, duplicate_count
@@ -203,8 +417,8 @@ class BaseScraper(ABC):
         self.logger.info(f"Starting {self.name} scraper")
         
         try:
-            # Scrape events
-            events = self.scrape()
+            # Scrape events; scrapers may return a list or a generator
+            events = list(self.scrape())
             self.logger.info(f"Scraped {len(events)} events")
             
             # Deduplicate events
@@ -3,26 +3,81 @@ Scraper for Hong Kong Trade Development Council (HKTDC) job fairs.
 """
 
 import re
+import asyncio
 from datetime import datetime
-import pytz
 import json
-from bs4 import BeautifulSoup
+import hishel
+import ahocorasick
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 
-from .base import BaseScraper
+from .base import BaseScraper, HKT
 from ..utils.normalizer import (
     normalize_date,
     normalize_datetime,
     normalize_venue_name,
     normalize_district,
+    has_cjk,
     extract_contact_info,
     clean_html
 )
 
+# Precompiled patterns shared by the extractors
+_DATE_RANGE_RE = re.compile(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s*[-至]\s*(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})')
+_CN_DATE_RANGE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日\s*[-至]\s*(\d{1,2})月(\d{1,2})日')
+_DATE_RE = re.compile(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})')
+_VENUE_RE = re.compile(r'地[點址場].*?[：:]\s*([^。！？\n]{3,50})')
+_URL_EVENT_RE = re.compile(r'/event/([^/]+)')
+
+# Keywords marking career-related events in the events calendar, compiled
+# into a single Aho-Corasick automaton so a title is scanned once instead
+# of once per keyword
+_KEYWORDS = ('career', 'job', 'employment', '\u5c31\u696d', '\u62db\u8058', '\u8077\u696d')
+_KW_AUTOMATON = ahocorasick.Automaton()
+for _keyword in _KEYWORDS:
+    _KW_AUTOMATON.add_word(_keyword, _keyword)
+_KW_AUTOMATON.make_automaton()
+
+# Precompiled CSS selectors (compiled to XPath once at import time)
+_LISTING_TITLE_SEL = CSSSelector('h3, h2, div.title')
+_LISTING_DATE_SEL = CSSSelector('div.date, span.date')
+_LISTING_VENUE_SEL = CSSSelector('div.venue, span.venue')
+_LINK_SEL = CSSSelector('a[href]')
+_EXPO_TITLE_SEL = CSSSelector('h1, h2.event-title')
+_EN_TITLE_SEL = CSSSelector('span.en-title, div.en-title')
+_ZH_TITLE_SEL = CSSSelector('span.zh-title, div.zh-title')
+_EXPO_DATE_SEL = CSSSelector('div.event-date, span.date')
+_EXPO_VENUE_SEL = CSSSelector('div.event-venue, span.venue')
+_DESC_SEL = CSSSelector('div.event-description, div.description')
+_SCHEDULE_SEL = CSSSelector('div.event-schedule, div.program')
+_SCHEDULE_DIV_SEL = CSSSelector('div.event-item')
+_SCHEDULE_ROW_SEL = CSSSelector('tr')
+_ITEM_FIELD_NAMES = frozenset(('date', 'time', 'title', 'venue'))
+_ITEM_FIELDS_SEL = CSSSelector(
+    'div.date, td.date, div.time, td.time, '
+    'div.title, td.title, div.venue, td.venue'
+)
+
+def _css_first(selector, node):
+    """
+    Return the first match of a precompiled CSS selector, or None.
+
+    Args:
+        selector (CSSSelector): Precompiled selector
+        node (lxml.html.HtmlElement): Element to search under
+
+    Returns:
+        lxml.html.HtmlElement: First matching element, or None
+    """
+    matches = selector(node)
+    return matches[0] if matches else None
+
 class HKTDCScraper(BaseScraper):
     """
     Scraper for Hong Kong Trade Development Council (HKTDC) job fairs.
     """
-    
+
     def __init__(self):
         """Initialize the HKTDC scraper."""
         super().__init__(
@@ -34,144 +89,218 @@ class HKTDCScraper(BaseScraper):
             check_frequency="DAILY",
             language="BOTH"
         )
-        
+
         # URLs for job fairs
         self.urls = {
             'education_expo': "https://www.hktdc.com/event/hkeducationexpo/tc",
             'events_calendar': "https://www.hktdc.com/event/schedule/tc",
             'career_expo': "https://www.hktdc.com/event/hkcareerexpo/tc",
         }
-    
+
+    def parse_html(self, html):
+        """
+        Parse HTML content with lxml (C-level tree, much faster than BS4).
+
+        Args:
+            html (str): HTML content
+
+        Returns:
+            lxml.html.HtmlElement: Document root
+        """
+        return lxml.html.fromstring(html, parser=self.lxml_parser())
+
+    def iter_calendar_listings(self, html):
+        """
+        Stream event listing divs from the calendar page.
+
+        Parses incrementally with a pull parser and clears each listing
+        subtree once the caller has consumed it, so peak memory stays flat
+        regardless of page size instead of holding the full document tree.
+
+        Args:
+            html (str): HTML content
+
+        Yields:
+            lxml.html.HtmlElement: Listing elements (event-item/event-card divs)
+        """
+        def matching_listings(events):
+            for _, elem in events:
+                if elem.tag != 'div':
+                    continue
+                classes = (elem.get('class') or '').split()
+                if 'event-item' in classes or 'event-card' in classes:
+                    yield elem
+
+        parser = etree.HTMLPullParser(events=('end',))
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        parser.feed(html)
+
+        for elem in matching_listings(parser.read_events()):
+            yield elem
+            # The caller is done with this listing - drop its subtree
+            elem.clear()
+
+        # In recover mode, elements still open at EOF (truncated or
+        # malformed markup) are only materialized by close(); drain any
+        # listings that surface then so trailing events aren't dropped
+        parser.close()
+        for elem in matching_listings(parser.read_events()):
+            yield elem
+            elem.clear()
+
     def scrape(self):
         """
         Scrape job fair information from HKTDC.
-        
+
+        Returns:
+            list: List of job fair events
+        """
+        return asyncio.run(self.scrape_async())
+
+    async def scrape_async(self):
+        """
+        Scrape all HKTDC pages concurrently over a shared HTTP session.
+
         Returns:
             list: List of job fair events
         """
         events = []
-        
-        # Scrape education expo page
-        self.logger.info("Scraping HKTDC Education & Careers Expo page")
-        events.extend(self.scrape_education_expo())
-        
-        # Scrape career expo page
-        self.logger.info("Scraping HKTDC Career Expo page")
-        events.extend(self.scrape_career_expo())
-        
-        # Scrape events calendar for additional job fairs
-        self.logger.info("Scraping HKTDC Events Calendar for job fairs")
-        events.extend(self.scrape_events_calendar())
-        
+
+        async with hishel.AsyncCacheClient(
+            storage=hishel.AsyncFileStorage(base_path=self.http_cache_dir),
+            http2=True,
+            headers=self.headers,
+            timeout=30,
+            follow_redirects=True
+        ) as session:
+            # The three pages are independent, so fetch them concurrently
+            results = await asyncio.gather(
+                self.scrape_education_expo(session),
+                self.scrape_career_expo(session),
+                self.scrape_events_calendar(session)
+            )
+
+        for result in results:
+            events.extend(result)
+
         return events
-    
-    def scrape_education_expo(self):
+
+    async def scrape_education_expo(self, session):
         """
         Scrape the Education & Careers Expo page.
-        
+
+        Args:
+            session (httpx.AsyncClient): Shared HTTP session
+
         Returns:
             list: List of job fair events
         """
         events = []
-        
+
         try:
             # Get the education expo page
-            response = self.get_page(self.urls['education_expo'])
-            soup = self.parse_html(response.text)
-            
+            self.logger.info("Scraping HKTDC Education & Careers Expo page")
+            html = await self.get_page_async(session, self.urls['education_expo'])
+            tree = self.parse_html(html)
+
             # Extract main expo information
-            event = self.extract_expo_info(soup, 'education_expo')
+            event = self.extract_expo_info(tree, 'education_expo')
             if event:
                 events.append(event)
-            
+
             # Extract sub-events if available
-            sub_events = self.extract_sub_events(soup, 'education_expo')
+            sub_events = self.extract_sub_events(tree, 'education_expo')
             events.extend(sub_events)
-            
+
         except Exception as e:
             self.logger.error(f"Error scraping education expo page: {e}", exc_info=True)
-        
+
         return events
-    
-    def scrape_career_expo(self):
+
+    async def scrape_career_expo(self, session):
         """
         Scrape the Career Expo page.
-        
+
+        Args:
+            session (httpx.AsyncClient): Shared HTTP session
+
         Returns:
             list: List of job fair events
         """
         events = []
-        
+
         try:
             # Get the career expo page
-            response = self.get_page(self.urls['career_expo'])
-            soup = self.parse_html(response.text)
-            
+            self.logger.info("Scraping HKTDC Career Expo page")
+            html = await self.get_page_async(session, self.urls['career_expo'])
+            tree = self.parse_html(html)
+
             # Extract main expo information
-            event = self.extract_expo_info(soup, 'career_expo')
+            event = self.extract_expo_info(tree, 'career_expo')
             if event:
                 events.append(event)
-            
+
             # Extract sub-events if available
-            sub_events = self.extract_sub_events(soup, 'career_expo')
+            sub_events = self.extract_sub_events(tree, 'career_expo')
             events.extend(sub_events)
-            
+
         except Exception as e:
             self.logger.error(f"Error scraping career expo page: {e}", exc_info=True)
-        
+
         return events
-    
-    def scrape_events_calendar(self):
+
+    async def scrape_events_calendar(self, session):
         """
         Scrape the Events Calendar for job fairs.
-        
+
+        Args:
+            session (httpx.AsyncClient): Shared HTTP session
+
         Returns:
             list: List of job fair events
         """
         events = []
-        
+
         try:
             # Get the events calendar page
-            response = self.get_page(self.urls['events_calendar'])
-            soup = self.parse_html(response.text)
-            
-            # Look for event listings
-            event_listings = soup.find_all('div', class_='event-item') or soup.find_all('div', class_='event-card')
-            
-            for listing in event_listings:
+            self.logger.info("Scraping HKTDC Events Calendar for job fairs")
+            html = await self.get_page_async(session, self.urls['events_calendar'])
+
+            # Stream the listings out of the page instead of building the
+            # whole document tree up front
+            for listing in self.iter_calendar_listings(html):
+                title = _css_first(_LISTING_TITLE_SEL, listing)
+                title_text = title.text_content().strip() if title is not None else None
+
+                # Skip listings with no title or not related to careers
+                if not title_text:
+                    continue
+
+                if next(_KW_AUTOMATON.iter(title_text.lower()), None) is None:
+                    continue
+
                 try:
-                    # Check if it's a job fair or career-related event
-                    title = listing.find('h3') or listing.find('h2') or listing.find('div', class_='title')
-                    if not title:
-                        continue
-                    
-                    title_text = title.get_text().strip()
-                    
-                    # Skip if not related to careers or job fairs
-                    if not any(keyword in title_text.lower() for keyword in ['career', 'job', 'employment', '就業', '招聘', '職業']):
-                        continue
-                    
                     # Extract event information
                     event = self.extract_event_from_listing(listing)
                     if event:
                         events.append(event)
-                
+
                 except Exception as e:
                     self.logger.error(f"Error extracting event from listing: {e}", exc_info=True)
-            
+
         except Exception as e:
             self.logger.error(f"Error scraping events calendar: {e}", exc_info=True)
-        
+
         return events
-    
-    def extract_expo_info(self, soup, expo_type):
+
+    def extract_expo_info(self, tree, expo_type):
         """
         Extract information about the main expo.
-        
+
         Args:
-            soup (BeautifulSoup): BeautifulSoup object for the page
+            tree (lxml.html.HtmlElement): Parsed page
             expo_type (str): Type of expo ('education_expo' or 'career_expo')
-            
+
         Returns:
             dict: Expo event data
         """
@@ -182,76 +311,81 @@ class HKTDCScraper(BaseScraper):
             'is_virtual': False,
             'organizer_name': "Hong Kong Trade Development Council",
         }
-        
+
+        # Full document text, computed at most once if a fallback needs it
+        full_text = None
+
         # Extract title
-        title_elem = soup.find('h1') or soup.find('h2', class_='event-title')
-        if title_elem:
-            title_text = title_elem.get_text().strip()
+        title_elem = _css_first(_EXPO_TITLE_SEL, tree)
+        if title_elem is not None:
+            title_text = title_elem.text_content().strip()
             event['event_name'] = title_text
-            
+
             # Determine language and set appropriate name field
-            if re.search(r'[\u4e00-\u9fff]', title_text):
+            if has_cjk(title_text):
                 event['event_name_zh'] = title_text
-                
+
                 # Look for English title
-                english_title = soup.find('span', class_='en-title') or soup.find('div', class_='en-title')
-                if english_title:
-                    event['event_name_en'] = english_title.get_text().strip()
+                english_title = _css_first(_EN_TITLE_SEL, tree)
+                if english_title is not None:
+                    event['event_name_en'] = english_title.text_content().strip()
             else:
                 event['event_name_en'] = title_text
-                
+
                 # Look for Chinese title
-                chinese_title = soup.find('span', class_='zh-title') or soup.find('div', class_='zh-title')
-                if chinese_title:
-                    event['event_name_zh'] = chinese_title.get_text().strip()
-        
+                chinese_title = _css_first(_ZH_TITLE_SEL, tree)
+                if chinese_title is not None:
+                    event['event_name_zh'] = chinese_title.text_content().strip()
+
         # Extract date
-        date_elem = soup.find('div', class_='event-date') or soup.find('span', class_='date')
-        if date_elem:
-            date_text = date_elem.get_text().strip()
-            
+        date_elem = _css_first(_EXPO_DATE_SEL, tree)
+        if date_elem is not None:
+            date_text = date_elem.text_content().strip()
+
             # Extract start and end dates
-            date_range_match = re.search(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s*[-至]\s*(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})', date_text)
+            date_range_match = _DATE_RANGE_RE.search(date_text)
             if date_range_match:
                 start_date, end_date = date_range_match.groups()
                 event['start_datetime'] = normalize_date(start_date)
                 event['end_datetime'] = normalize_date(end_date)
             else:
                 # Try to find single date
-                date_match = re.search(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})', date_text)
+                date_match = _DATE_RE.search(date_text)
                 if date_match:
                     event['start_datetime'] = normalize_date(date_match.group(1))
-        
+
         # If no date found, look for date in text
         if 'start_datetime' not in event:
-            text = soup.get_text()
-            
+            if full_text is None:
+                full_text = tree.text_content()
+
             # Look for date patterns
-            date_range_match = re.search(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s*[-至]\s*(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})', text)
+            date_range_match = _DATE_RANGE_RE.search(full_text)
             if date_range_match:
                 start_date, end_date = date_range_match.groups()
                 event['start_datetime'] = normalize_date(start_date)
                 event['end_datetime'] = normalize_date(end_date)
             else:
                 # Try Chinese date format
-                cn_date_range_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日\s*[-至]\s*(\d{1,2})月(\d{1,2})日', text)
+                cn_date_range_match = _CN_DATE_RANGE_RE.search(full_text)
                 if cn_date_range_match:
                     year, start_month, start_day, end_month, end_day = cn_date_range_match.groups()
                     event['start_datetime'] = f"{year}-{start_month.zfill(2)}-{start_day.zfill(2)}"
                     event['end_datetime'] = f"{year}-{end_month.zfill(2)}-{end_day.zfill(2)}"
-        
+
         # Extract venue
-        venue_elem = soup.find('div', class_='event-venue') or soup.find('span', class_='venue')
-        if venue_elem:
-            venue_text = venue_elem.get_text().strip()
+        venue_elem = _css_first(_EXPO_VENUE_SEL, tree)
+        if venue_elem is not None:
+            venue_text = venue_elem.text_content().strip()
             event['venue_name'] = normalize_venue_name(venue_text)
             event['venue_address'] = venue_text
             event['district'] = normalize_district(venue_text)
-        
+
         # If no venue found, look for venue in text
         if 'venue_name' not in event:
-            text = soup.get_text()
-            venue_match = re.search(r'地[點址場].*?[：:]\s*([^。！？\n]{3,50})', text)
+            if full_text is None:
+                full_text = tree.text_content()
+            venue_match = _VENUE_RE.search(full_text)
             if venue_match:
                 venue = venue_match.group(1).strip()
                 event['venue_name'] = normalize_venue_name(venue)
@@ -262,21 +396,21 @@ class HKTDCScraper(BaseScraper):
                 event['venue_name'] = "香港會議展覽中心"
                 event['venue_address'] = "香港灣仔博覽道1號"
                 event['district'] = "灣仔"
-        
+
         # Extract description
-        desc_elem = soup.find('div', class_='event-description') or soup.find('div', class_='description')
-        if desc_elem:
-            event['description'] = clean_html(str(desc_elem))
-            
+        desc_elem = _css_first(_DESC_SEL, tree)
+        if desc_elem is not None:
+            event['description'] = clean_html(lxml.html.tostring(desc_elem, encoding='unicode', with_tail=False))
+
             # Determine language and set appropriate description field
-            if re.search(r'[\u4e00-\u9fff]', event['description']):
+            if has_cjk(event['description']):
                 event['description_zh'] = event['description']
             else:
                 event['description_en'] = event['description']
-        
+
         # Extract website link
         event['website_link'] = self.urls[expo_type]
-        
+
         # Set language based on content
         if 'event_name_zh' in event and 'event_name_en' in event:
             event['language'] = 'BOTH'
@@ -284,10 +418,10 @@ class HKTDCScraper(BaseScraper):
             event['language'] = 'ZH-HK'
         else:
             event['language'] = 'EN'
-        
+
         # Set status
         event['status'] = 'UPCOMING'
-        
+
         # Set default values for required fields if not found
         if 'event_name' not in event:
             if expo_type == 'education_expo':
@@ -298,61 +432,59 @@ class HKTDCScraper(BaseScraper):
                 event['event_name'] = "HKTDC Career Expo"
                 event['event_name_en'] = "HKTDC Career Expo"
                 event['event_name_zh'] = "香港貿發局職業博覽"
-        
+
         if 'start_datetime' not in event:
             # Use next January as default for education expo (typically held in January)
-            now = datetime.now(pytz.timezone('Asia/Hong_Kong'))
+            now = datetime.now(HKT)
             next_year = now.year + 1 if now.month > 1 else now.year
             event['start_datetime'] = f"{next_year}-01-15"
-        
+
         return event
-    
-    def extract_sub_events(self, soup, expo_type):
+
+    def extract_sub_events(self, tree, expo_type):
         """
         Extract sub-events from the expo page.
-        
+
         Args:
-            soup (BeautifulSoup): BeautifulSoup object for the page
+            tree (lxml.html.HtmlElement): Parsed page
             expo_type (str): Type of expo ('education_expo' or 'career_expo')
-            
+
         Returns:
             list: List of sub-event data
         """
         sub_events = []
-        
+
         # Look for event schedule or program
-        schedule_section = soup.find('div', class_='event-schedule') or soup.find('div', class_='program')
-        if not schedule_section:
+        schedule_section = _css_first(_SCHEDULE_SEL, tree)
+        if schedule_section is None:
             return sub_events
-        
+
         # Look for event items
-        event_items = schedule_section.find_all('div', class_='event-item') or schedule_section.find_all('tr')
-        
+        event_items = _SCHEDULE_DIV_SEL(schedule_section) or _SCHEDULE_ROW_SEL(schedule_section)
+
         for item in event_items:
             try:
-                # Extract date
-                date_elem = item.find('div', class_='date') or item.find('td', class_='date')
-                if not date_elem:
+                # Collect date/time/title/venue in one traversal of the item
+                # instead of one tree descent per field; first match wins
+                fields = {}
+                for elem in _ITEM_FIELDS_SEL(item):
+                    for cls in (elem.get('class') or '').split():
+                        if cls in _ITEM_FIELD_NAMES and cls not in fields:
+                            fields[cls] = elem.text_content().strip()
+
+                date_text = fields.get('date')
+                if not date_text:
                     continue
-                
-                date_text = date_elem.get_text().strip()
+
                 date = normalize_date(date_text)
-                
-                # Extract time
-                time_elem = item.find('div', class_='time') or item.find('td', class_='time')
-                time_text = time_elem.get_text().strip() if time_elem else ""
-                
-                # Extract title
-                title_elem = item.find('div', class_='title') or item.find('td', class_='title')
-                if not title_elem:
+                time_text = fields.get('time', "")
+
+                title_text = fields.get('title')
+                if not title_text:
                     continue
-                
-                title_text = title_elem.get_text().strip()
-                
-                # Extract venue
-                venue_elem = item.find('div', class_='venue') or item.find('td', class_='venue')
-                venue_text = venue_elem.get_text().strip() if venue_elem else ""
-                
+
+                venue_text = fields.get('venue', "")
+
                 # Create sub-event
                 sub_event = {
                     'event_name': title_text,
@@ -368,29 +500,29 @@ class HKTDCScraper(BaseScraper):
                     'website_link': self.urls[expo_type],
                     'status': 'UPCOMING'
                 }
-                
+
                 # Determine language and set appropriate name field
-                if re.search(r'[\u4e00-\u9fff]', title_text):
+                if has_cjk(title_text):
                     sub_event['event_name_zh'] = title_text
                     sub_event['language'] = 'ZH-HK'
                 else:
                     sub_event['event_name_en'] = title_text
                     sub_event['language'] = 'EN'
-                
+
                 sub_events.append(sub_event)
-            
+
             except Exception as e:
                 self.logger.error(f"Error extracting sub-event: {e}", exc_info=True)
-        
+
         return sub_events
-    
+
     def extract_event_from_listing(self, listing):
         """
         Extract event information from a listing in the events calendar.
-        
+
         Args:
-            listing (BeautifulSoup): BeautifulSoup object for the listing
-            
+            listing (lxml.html.HtmlElement): Listing element
+
         Returns:
             dict: Event data
         """
@@ -400,67 +532,68 @@ class HKTDCScraper(BaseScraper):
             'is_virtual': False,
             'organizer_name': "Hong Kong Trade Development Council",
         }
-        
+
         # Extract title
-        title_elem = listing.find('h3') or listing.find('h2') or listing.find('div', class_='title')
-        if title_elem:
-            title_text = title_elem.get_text().strip()
+        title_elem = _css_first(_LISTING_TITLE_SEL, listing)
+        if title_elem is not None:
+            title_text = title_elem.text_content().strip()
             event['event_name'] = title_text
-            
+
             # Determine language and set appropriate name field
-            if re.search(r'[\u4e00-\u9fff]', title_text):
+            if has_cjk(title_text):
                 event['event_name_zh'] = title_text
                 event['language'] = 'ZH-HK'
             else:
                 event['event_name_en'] = title_text
                 event['language'] = 'EN'
-        
+
         # Extract date
-        date_elem = listing.find('div', class_='date') or listing.find('span', class_='date')
-        if date_elem:
-            date_text = date_elem.get_text().strip()
-            
+        date_elem = _css_first(_LISTING_DATE_SEL, listing)
+        if date_elem is not None:
+            date_text = date_elem.text_content().strip()
+
             # Extract start and end dates
-            date_range_match = re.search(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s*[-至]\s*(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})', date_text)
+            date_range_match = _DATE_RANGE_RE.search(date_text)
             if date_range_match:
                 start_date, end_date = date_range_match.groups()
                 event['start_datetime'] = normalize_date(start_date)
                 event['end_datetime'] = normalize_date(end_date)
             else:
                 # Try to find single date
-                date_match = re.search(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})', date_text)
+                date_match = _DATE_RE.search(date_text)
                 if date_match:
                     event['start_datetime'] = normalize_date(date_match.group(1))
-        
+
         # Extract venue
-        venue_elem = listing.find('div', class_='venue') or listing.find('span', class_='venue')
-        if venue_elem:
-            venue_text = venue_elem.get_text().strip()
+        venue_elem = _css_first(_LISTING_VENUE_SEL, listing)
+        if venue_elem is not None:
+            venue_text = venue_elem.text_content().strip()
             event['venue_name'] = normalize_venue_name(venue_text)
             event['venue_address'] = venue_text
             event['district'] = normalize_district(venue_text)
-        
+
         # Extract link
-        link_elem = listing.find('a', href=True)
-        if link_elem:
-            event['website_link'] = self.base_url + link_elem['href'] if link_elem['href'].startswith('/') else link_elem['href']
-            
+        link_elem = _css_first(_LINK_SEL, listing)
+        if link_elem is not None:
+            href = link_elem.get('href')
+            event['website_link'] = self.base_url + href if href.startswith('/') else href
+
             # Extract source_event_id from URL
-            url_match = re.search(r'/event/([^/]+)', event['website_link'])
+            url_match = _URL_EVENT_RE.search(event['website_link'])
             if url_match:
                 event['source_event_id'] = url_match.group(1)
-        
+
         # Set status
         event['status'] = 'UPCOMING'
-        
+
         # Set default values for required fields if not found
         if 'event_name' not in event:
             return None
-        
+
         if 'venue_name' not in event:
             # Default to HKCEC for HKTDC events
             event['venue_name'] = "香港會議展覽中心"
             event['venue_address'] = "香港灣仔博覽道1號"
             event['district'] = "灣仔"
-        
+
         return event
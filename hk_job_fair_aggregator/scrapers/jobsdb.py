@@ -2,18 +2,12 @@
 Scraper for JobsDB Hong Kong job fairs.
 """
 
+import os
 import re
-import time
-from datetime import datetime
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 import pytz
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 
 from .base import BaseScraper
 from ..utils.normalizer import (
@@ -22,14 +16,45 @@ from ..utils.normalizer import (
     normalize_venue_name,
     normalize_district,
     extract_contact_info,
-    clean_html
+    clean_html,
+    has_cjk
 )
 
+# Patterns used per card/entry, compiled once at import time
+_DATE_RE = re.compile(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})')
+_DAYS_AGO_RE = re.compile(r'(\d+)\s+days?\s+ago')
+_URL_EVENT_RE = re.compile(r'/job/([^/]+)')
+
+# pytz timezone lookup is not free; resolve it once at import time
+_HK_TZ = pytz.timezone('Asia/Hong_Kong')
+
+# Resolved once per process; ChromeDriverManager().install() may hit the
+# network to determine the matching driver version
+_chromedriver_path = None
+
+def _get_chromedriver_path():
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        # A preinstalled driver (Docker/CI images) makes webdriver-manager's
+        # version-resolution network round-trip unnecessary
+        _chromedriver_path = os.environ.get('CHROMEDRIVER_PATH') or shutil.which('chromedriver')
+    if _chromedriver_path is None:
+        # Silence webdriver-manager's version-resolution chatter and keep
+        # its download cache project-local; must be set before the import
+        os.environ.setdefault('WDM_LOG_LEVEL', '0')
+        os.environ.setdefault('WDM_LOCAL', '1')
+        from webdriver_manager.chrome import ChromeDriverManager
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
 class JobsDBScraper(BaseScraper):
     """
     Scraper for JobsDB Hong Kong job fairs.
     """
-    
+
+    # Shared across instances so repeated scrapes reuse one Chrome process
+    _driver = None
+
     def __init__(self):
         """Initialize the JobsDB scraper."""
         super().__init__(
@@ -47,6 +72,14 @@ class JobsDBScraper(BaseScraper):
             'recruitment_day': "https://hk.jobsdb.com/招聘日-recruitment-day-jobs",
             'job_fair': "https://hk.jobsdb.com/job-fair-jobs",
         }
+
+        # The listing pages above are rendered from a JSON search API;
+        # querying it directly avoids launching a browser at all
+        self.api_url = "https://hk.jobsdb.com/api/jobsearch/v5/search"
+        self.api_keywords = {
+            'recruitment_day': "招聘日 recruitment day",
+            'job_fair': "job fair",
+        }
     
     def setup_driver(self):
         """
@@ -55,6 +88,12 @@ class JobsDBScraper(BaseScraper):
         Returns:
             webdriver.Chrome: Chrome WebDriver instance
         """
+        # Imported lazily so runs served entirely by the JSON API never
+        # pay Selenium's import cost
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -62,39 +101,219 @@ class JobsDBScraper(BaseScraper):
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-        
-        service = Service(ChromeDriverManager().install())
+
+        # We only read DOM text, so return at DOMContentLoaded instead of
+        # waiting for images/fonts/stylesheets to finish downloading
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+
+        # Chrome's default logging serializes stderr writes on every
+        # driver command; keep it quiet
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
+        chrome_options.add_argument("--log-level=3")
+        chrome_options.add_argument("--silent")
+        chrome_options.add_argument("--disable-logging")
+
+        service = Service(_get_chromedriver_path(), log_output=os.devnull)
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        
+
         return driver
-    
+
+    def get_driver(self):
+        """
+        Get the shared WebDriver, creating it on first use.
+
+        Returns:
+            webdriver.Chrome: Chrome WebDriver instance
+        """
+        if JobsDBScraper._driver is None:
+            JobsDBScraper._driver = self.setup_driver()
+        return JobsDBScraper._driver
+
+    def close(self):
+        """Release the pooled HTTP connections and the shared WebDriver."""
+        if JobsDBScraper._driver is not None:
+            try:
+                JobsDBScraper._driver.quit()
+            except Exception:
+                pass
+            JobsDBScraper._driver = None
+        super().close()
+
     def scrape(self):
         """
         Scrape job fair information from JobsDB.
-        
+
+        Yields:
+            dict: Job fair events
+        """
+        fallback = []
+
+        # The two searches are independent and network-bound, so prefer
+        # the JSON API and issue both requests concurrently; it skips
+        # browser startup, lazy-load scrolling and WebDriver round-trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(self.scrape_api, self.api_keywords[event_type], event_type): event_type
+                for event_type in self.urls
+            }
+            for future in as_completed(futures):
+                event_type = futures[future]
+                self.logger.info(f"Scraping JobsDB {event_type} listings")
+                try:
+                    api_events = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error in JobsDB scraper: {e}", exc_info=True)
+                    continue
+                if api_events is not None:
+                    yield from api_events
+                else:
+                    fallback.append(event_type)
+
+        # Fall back to the rendered pages only when the API fails; they
+        # share the warm driver, so they run serially
+        if fallback:
+            try:
+                driver = self.get_driver()
+                for event_type in fallback:
+                    self.logger.info(f"Scraping JobsDB {event_type} page via browser")
+                    yield from self.scrape_page(driver, self.urls[event_type], event_type)
+            except Exception as e:
+                self.logger.error(f"Error in JobsDB scraper: {e}", exc_info=True)
+
+    def scrape_api(self, keywords, event_type):
+        """
+        Scrape job fair listings from the JobsDB search API.
+
+        Args:
+            keywords (str): Search keywords
+            event_type (str): Type of event ('recruitment_day' or 'job_fair')
+
         Returns:
-            list: List of job fair events
+            list: List of job fair events, or None if the API call failed
+                and the caller should fall back to the browser
         """
-        events = []
-        
         try:
-            driver = self.setup_driver()
-            
-            # Scrape recruitment day page
-            self.logger.info("Scraping JobsDB recruitment day page")
-            events.extend(self.scrape_page(driver, self.urls['recruitment_day'], 'recruitment_day'))
-            
-            # Scrape job fair page
-            self.logger.info("Scraping JobsDB job fair page")
-            events.extend(self.scrape_page(driver, self.urls['job_fair'], 'job_fair'))
-            
-            driver.quit()
-            
+            response = self.get_page(self.api_url, params={
+                'siteKey': 'HK-Main',
+                'sourcesystem': 'houston',
+                'keywords': keywords,
+                'pageSize': 100,
+                'locale': 'en-HK',
+            })
+            jobs = response.json().get('data')
         except Exception as e:
-            self.logger.error(f"Error in JobsDB scraper: {e}", exc_info=True)
-        
+            self.logger.error(f"JobsDB API search failed, falling back to browser: {e}")
+            return None
+
+        # A 200 response without a 'data' key means the endpoint shape
+        # changed; treat it like a failure so the browser fallback runs.
+        # A present-but-empty list is a legitimate empty result
+        if jobs is None:
+            self.logger.error("JobsDB API response has no 'data' key, falling back to browser")
+            return None
+
+        events = []
+        for job in jobs:
+            try:
+                event = self.parse_job_json(job, event_type)
+                if event:
+                    events.append(event)
+            except Exception as e:
+                self.logger.error(f"Error parsing API job entry: {e}", exc_info=True)
+
+        self.logger.info(f"Found {len(events)} {event_type} events via API")
         return events
-    
+
+    def parse_job_json(self, job, event_type):
+        """
+        Parse a job entry from the JobsDB search API response.
+
+        Args:
+            job (dict): Job entry from the API response
+            event_type (str): Type of event ('recruitment_day' or 'job_fair')
+
+        Returns:
+            dict: Job fair event data
+        """
+        title = (job.get('title') or '').strip()
+        if not title:
+            return None
+
+        event = {
+            'event_type': event_type,
+            'source_event_id': None,
+            'is_physical': True,
+            'is_virtual': False,
+            'event_name': title,
+        }
+
+        # Determine language and set appropriate name field
+        if has_cjk(title):
+            event['event_name_zh'] = title
+        else:
+            event['event_name_en'] = title
+
+        # Extract company/organizer
+        advertiser = job.get('advertiser') or {}
+        organizer = job.get('companyName') or advertiser.get('description')
+        event['organizer_name'] = organizer.strip() if organizer else "JobsDB Recruitment Day"
+
+        # Extract location
+        job_location = job.get('jobLocation') or {}
+        location = (job_location.get('displayAddress') or '').strip()
+        if location:
+            event['venue_name'] = normalize_venue_name(location)
+            event['venue_address'] = location
+            event['district'] = normalize_district(location)
+        else:
+            event['venue_name'] = "待定"  # To be determined
+
+        # Extract date (listingDate is ISO 8601, e.g. 2023-11-20T03:00:00Z)
+        listing_date = job.get('listingDate') or ''
+        if listing_date:
+            event['start_datetime'] = normalize_date(listing_date.split('T')[0])
+        else:
+            event['start_datetime'] = datetime.now(_HK_TZ).strftime('%Y-%m-%d')
+
+        # Extract link to details page
+        job_id = job.get('id')
+        if job_id is not None:
+            event['source_event_id'] = str(job_id)
+            event['website_link'] = f"{self.base_url}/job/{job_id}"
+
+        # Extract description
+        description = (job.get('teaser') or '').strip()
+        event['description'] = description
+        if description:
+            if has_cjk(description):
+                event['description_zh'] = description
+            else:
+                event['description_en'] = description
+
+        # Set language based on content
+        if 'event_name_zh' in event and 'event_name_en' in event:
+            event['language'] = 'BOTH'
+        elif 'event_name_zh' in event:
+            event['language'] = 'ZH-HK'
+        else:
+            event['language'] = 'EN'
+
+        # Set status
+        event['status'] = 'UPCOMING'
+
+        return event
+
     def scrape_page(self, driver, url, event_type):
         """
         Scrape a JobsDB page for job fair listings.
@@ -103,12 +322,15 @@ class JobsDBScraper(BaseScraper):
             driver (webdriver.Chrome): Chrome WebDriver instance
             url (str): URL to scrape
             event_type (str): Type of event ('recruitment_day' or 'job_fair')
-            
-        Returns:
-            list: List of job fair events
+
+        Yields:
+            dict: Job fair events
         """
-        events = []
-        
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+
         try:
             # Load the page
             self.logger.info(f"Loading page: {url}")
@@ -121,157 +343,196 @@ class JobsDBScraper(BaseScraper):
             
             # Scroll down to load more content (JobsDB uses lazy loading)
             self.scroll_to_load_more(driver)
-            
-            # Extract job cards
-            job_cards = driver.find_elements(By.CSS_SELECTOR, "article.job-card")
+
+            # Pull every card's fields out of the page in one script call
+            # instead of several WebDriver round-trips per card
+            job_cards = self.extract_job_cards(driver)
             self.logger.info(f"Found {len(job_cards)} job cards")
-            
+
+            # One timestamp for the whole page; the fallback date branches
+            # reference it instead of resolving the timezone per card
+            today = datetime.now(_HK_TZ)
+            today_str = today.strftime('%Y-%m-%d')
+
             for card in job_cards:
                 try:
-                    event = self.parse_job_card(card, event_type)
+                    event = self.parse_job_card(card, event_type, today, today_str)
                     if event:
-                        events.append(event)
+                        yield event
                 except Exception as e:
                     self.logger.error(f"Error parsing job card: {e}", exc_info=True)
-            
+
         except TimeoutException:
             self.logger.error(f"Timeout waiting for page to load: {url}")
         except Exception as e:
             self.logger.error(f"Error scraping page {url}: {e}", exc_info=True)
-        
-        return events
     
     def scroll_to_load_more(self, driver, max_scrolls=10):
         """
         Scroll down to load more content.
-        
+
+        Waits for the document height to grow after each scroll and stops
+        as soon as it is stable, so short pages exit after one scroll
+        instead of exhausting max_scrolls.
+
         Args:
             driver (webdriver.Chrome): Chrome WebDriver instance
             max_scrolls (int): Maximum number of scrolls
         """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
+        last_height = driver.execute_script("return document.body.scrollHeight")
+
         for i in range(max_scrolls):
-            # Scroll down
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            # Wait for content to load
-            time.sleep(2)
-            
-            # Check if there's a "Load more" button and click it
+            # Scroll down and click any load-more button in one round-trip
+            driver.execute_script(self._SCROLL_AND_LOAD_JS)
+
+            # Wait for the page to actually grow rather than sleeping
             try:
-                load_more = driver.find_element(By.XPATH, "//button[contains(text(), 'Load more') or contains(text(), '載入更多')]")
-                load_more.click()
-                time.sleep(2)
-            except NoSuchElementException:
-                pass
+                WebDriverWait(driver, 3).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") > last_height
+                )
+            except TimeoutException:
+                # Height is stable — no more content
+                break
+
+            last_height = driver.execute_script("return document.body.scrollHeight")
     
-    def parse_job_card(self, card, event_type):
+    # Scrolls to the bottom and clicks a load-more button if present, all
+    # inside the page so each iteration costs one IPC round-trip
+    _SCROLL_AND_LOAD_JS = """
+        window.scrollTo(0, document.body.scrollHeight);
+        var buttons = document.querySelectorAll('button');
+        for (var i = 0; i < buttons.length; i++) {
+            var label = buttons[i].textContent;
+            if (label.indexOf('Load more') !== -1 || label.indexOf('載入更多') !== -1) {
+                buttons[i].click();
+                break;
+            }
+        }
+    """
+
+    # Runs inside the page: one IPC round-trip returns every card's raw
+    # fields instead of several find_element calls per card
+    _EXTRACT_CARDS_JS = """
+        return Array.from(document.querySelectorAll('article.job-card')).map(function (card) {
+            function text(sel) {
+                var el = card.querySelector(sel);
+                return el ? el.textContent.trim() : null;
+            }
+            var link = card.querySelector('a.job-link, a.job-card-link');
+            return {
+                title: text('h1, h2, h3, .job-title'),
+                subtitle: text('.job-subtitle, .subtitle'),
+                company: text('.company-name, .employer-name'),
+                location: text('.job-location, .location-label'),
+                date: text('.job-date, .posted-date, .date-label'),
+                href: link ? link.href : null,
+                description: text('.job-description, .description')
+            };
+        });
+    """
+
+    def extract_job_cards(self, driver):
         """
-        Parse a job card element.
-        
+        Extract the raw fields of every job card in one script call.
+
         Args:
-            card (WebElement): Job card element
+            driver (webdriver.Chrome): Chrome WebDriver instance
+
+        Returns:
+            list: One dict of raw field strings per card
+        """
+        return driver.execute_script(self._EXTRACT_CARDS_JS)
+
+    def parse_job_card(self, card, event_type, today, today_str):
+        """
+        Parse the raw fields of a job card.
+
+        Args:
+            card (dict): Card fields returned by extract_job_cards
             event_type (str): Type of event ('recruitment_day' or 'job_fair')
-            
+            today (datetime): Current time in Hong Kong
+            today_str (str): Current date as YYYY-MM-DD
+
         Returns:
             dict: Job fair event data
         """
+        title = (card.get('title') or '').strip()
+        if not title:
+            # If no title found, skip this card
+            return None
+
         event = {
             'event_type': event_type,
             'source_event_id': None,
             'is_physical': True,
             'is_virtual': False,
+            'event_name': title,
         }
-        
-        # Extract title
-        try:
-            title_elem = card.find_element(By.CSS_SELECTOR, "h1, h2, h3, .job-title")
-            event['event_name'] = title_elem.text.strip()
-            
-            # Determine language and set appropriate name field
-            if re.search(r'[\u4e00-\u9fff]', event['event_name']):
-                event['event_name_zh'] = event['event_name']
-                # Try to find English title
-                subtitle = card.find_element(By.CSS_SELECTOR, ".job-subtitle, .subtitle").text.strip()
-                if subtitle and not re.search(r'[\u4e00-\u9fff]', subtitle):
-                    event['event_name_en'] = subtitle
-            else:
-                event['event_name_en'] = event['event_name']
-                # Try to find Chinese title
-                subtitle = card.find_element(By.CSS_SELECTOR, ".job-subtitle, .subtitle").text.strip()
-                if subtitle and re.search(r'[\u4e00-\u9fff]', subtitle):
-                    event['event_name_zh'] = subtitle
-        except NoSuchElementException:
-            # If no title found, skip this card
-            return None
-        
+
+        # Determine language and set appropriate name field
+        subtitle = (card.get('subtitle') or '').strip()
+        if has_cjk(title):
+            event['event_name_zh'] = title
+            # Try to find English title
+            if subtitle and not has_cjk(subtitle):
+                event['event_name_en'] = subtitle
+        else:
+            event['event_name_en'] = title
+            # Try to find Chinese title
+            if subtitle and has_cjk(subtitle):
+                event['event_name_zh'] = subtitle
+
         # Extract company/organizer
-        try:
-            company_elem = card.find_element(By.CSS_SELECTOR, ".company-name, .employer-name")
-            event['organizer_name'] = company_elem.text.strip()
-        except NoSuchElementException:
-            event['organizer_name'] = "JobsDB Recruitment Day"
-        
+        company = (card.get('company') or '').strip()
+        event['organizer_name'] = company if company else "JobsDB Recruitment Day"
+
         # Extract location
-        try:
-            location_elem = card.find_element(By.CSS_SELECTOR, ".job-location, .location-label")
-            location = location_elem.text.strip()
+        location = (card.get('location') or '').strip()
+        if location:
             event['venue_name'] = normalize_venue_name(location)
             event['venue_address'] = location
             event['district'] = normalize_district(location)
-        except NoSuchElementException:
+        else:
             event['venue_name'] = "待定"  # To be determined
-        
+
         # Extract date
-        try:
-            # Look for date in various formats
-            date_elem = card.find_element(By.CSS_SELECTOR, ".job-date, .posted-date, .date-label")
-            date_text = date_elem.text.strip()
-            
-            # Try to extract date from text
-            date_match = re.search(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{4}[-/]\d{1,2}[-/]\d{1,2})', date_text)
-            if date_match:
-                date_str = date_match.group(1)
-                event['start_datetime'] = normalize_date(date_str)
+        date_text = (card.get('date') or '').strip()
+        date_match = _DATE_RE.search(date_text)
+        if date_match:
+            event['start_datetime'] = normalize_date(date_match.group(1))
+        else:
+            # Try to extract date from relative time (e.g., "3 days ago")
+            days_ago_match = _DAYS_AGO_RE.search(date_text)
+            if days_ago_match:
+                days = int(days_ago_match.group(1))
+                event_date = today - timedelta(days=days)
+                event['start_datetime'] = event_date.strftime('%Y-%m-%d')
             else:
-                # Try to extract date from relative time (e.g., "3 days ago")
-                days_ago_match = re.search(r'(\d+)\s+days?\s+ago', date_text)
-                if days_ago_match:
-                    days = int(days_ago_match.group(1))
-                    today = datetime.now(pytz.timezone('Asia/Hong_Kong'))
-                    event_date = today - timedelta(days=days)
-                    event['start_datetime'] = event_date.strftime('%Y-%m-%d')
-                else:
-                    # If no date found, use today's date
-                    event['start_datetime'] = datetime.now(pytz.timezone('Asia/Hong_Kong')).strftime('%Y-%m-%d')
-        except NoSuchElementException:
-            # If no date found, use today's date
-            event['start_datetime'] = datetime.now(pytz.timezone('Asia/Hong_Kong')).strftime('%Y-%m-%d')
-        
+                # If no date found, use today's date
+                event['start_datetime'] = today_str
+
         # Extract link to details page
-        try:
-            link_elem = card.find_element(By.CSS_SELECTOR, "a.job-link, a.job-card-link")
-            event['website_link'] = link_elem.get_attribute('href')
-            
+        href = card.get('href')
+        if href:
+            event['website_link'] = href
+
             # Extract source_event_id from URL
-            url_match = re.search(r'/job/([^/]+)', event['website_link'])
+            url_match = _URL_EVENT_RE.search(href)
             if url_match:
                 event['source_event_id'] = url_match.group(1)
-        except NoSuchElementException:
-            pass
-        
+
         # Extract description
-        try:
-            desc_elem = card.find_element(By.CSS_SELECTOR, ".job-description, .description")
-            event['description'] = desc_elem.text.strip()
-            
-            # Determine language and set appropriate description field
-            if re.search(r'[\u4e00-\u9fff]', event['description']):
-                event['description_zh'] = event['description']
+        description = (card.get('description') or '').strip()
+        event['description'] = description
+        if description:
+            if has_cjk(description):
+                event['description_zh'] = description
             else:
-                event['description_en'] = event['description']
-        except NoSuchElementException:
-            event['description'] = ""
-        
+                event['description_en'] = description
+
         # Set language based on content
         if 'event_name_zh' in event and 'event_name_en' in event:
             event['language'] = 'BOTH'
@@ -279,8 +540,8 @@ class JobsDBScraper(BaseScraper):
             event['language'] = 'ZH-HK'
         else:
             event['language'] = 'EN'
-        
+
         # Set status
         event['status'] = 'UPCOMING'
-        
+
         return event
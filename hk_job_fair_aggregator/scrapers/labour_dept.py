@@ -3,16 +3,13 @@ Scraper for the Hong Kong Labour Department job fairs.
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pytz
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from scrapers.base import BaseScraper
-from utils.normalizer import (
+from .base import BaseScraper
+from ..utils.normalizer import (
     normalize_date,
     normalize_datetime,
     normalize_venue_name,
@@ -21,6 +18,48 @@ from utils.normalizer import (
     clean_html
 )
 
+# Patterns used on every section/page parse, compiled once at import time
+_ZH_DATE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+_DATE_LINE_RE = re.compile(r'(\d{4}年\d{1,2}月\d{1,2}日[^。！？\n]{0,60})')
+_TIME_RANGE_RE = re.compile(r'(\d{1,2}:\d{2})\s*[至-]\s*(\d{1,2}:\d{2})')
+_VENUE_VALUE_RE = re.compile(r'(?:地點|地址|場地)[：:]\s*([^。！？\n]{3,50})')
+_ORGANIZER_VALUE_RE = re.compile(r'(?:主辦|舉辦)機構[：:]\s*([^。！？\n]{1,50})')
+_CONTACT_LINE_RE = re.compile(r'((?:聯絡|查詢|電話|電郵)[^。\n]{0,80})')
+_VENUE_HINT_RE = re.compile(r'地[點址場].*?[：:]\s*([^。！？\n]{3,50})')
+_NAME_HINT_RE = re.compile(r'([^。！？\n]{5,30})[^\n]*$')
+
+# Only the listing containers matter, so skip materializing the rest of
+# the document while parsing
+_SECTION_STRAINER = SoupStrainer('div', class_=['job-fair-item', 'content-box', 'recruitment-day-item'])
+
+def _after_colon(text):
+    """
+    Get the text after the first full-width or ASCII colon.
+
+    Args:
+        text (str): Key:value text
+
+    Returns:
+        str: Trimmed value after the colon up to the end of the line,
+            or None if there is none
+    """
+    i = text.find('：')
+    j = text.find(':')
+    if i < 0:
+        k = j
+    elif j < 0:
+        k = i
+    else:
+        k = min(i, j)
+    if k < 0:
+        return None
+    # Stop at the end of the line, like the [^\n] value regexes, so a
+    # line break inside the span doesn't leak the following label in
+    end = text.find('\n', k)
+    if end < 0:
+        end = len(text)
+    return text[k + 1:end].strip() or None
+
 class LabourDeptScraper(BaseScraper):
     """
     Scraper for the Hong Kong Labour Department job fairs.
@@ -49,99 +88,95 @@ class LabourDeptScraper(BaseScraper):
     def scrape(self):
         """
         Scrape job fair information from the Labour Department website.
-        
-        Returns:
-            list: List of job fair events
+
+        Yields:
+            dict: Job fair events
         """
-        events = []
-        
-        # Scrape main job fair page
-        self.logger.info("Scraping Labour Department main job fair page")
-        events.extend(self.scrape_main_page())
-        
-        # Scrape recruitment day page
-        self.logger.info("Scraping Labour Department recruitment day page")
-        events.extend(self.scrape_recruitment_day_page())
-        
-        return events
+        # The two pages are independent, so fetch them concurrently; each
+        # worker drains its page generator so the parsing happens in the
+        # pool, then events stream out to the caller
+        self.logger.info("Scraping Labour Department job fair pages")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            main_future = executor.submit(lambda: list(self.scrape_main_page()))
+            recruitment_future = executor.submit(lambda: list(self.scrape_recruitment_day_page()))
+            yield from main_future.result()
+            yield from recruitment_future.result()
     
     def scrape_main_page(self):
         """
         Scrape the main job fair page.
         
-        Returns:
-            list: List of job fair events
+        Yields:
+            dict: Job fair events
         """
-        events = []
-        
+        found = 0
+
         try:
             # Get the main page
             response = self.get_page(self.urls['main'])
-            soup = self.parse_html(response.text)
-            
-            # Find job fair listings
-            job_fair_sections = soup.find_all('div', class_='job-fair-item')
-            
-            if not job_fair_sections:
-                # Try alternative selectors if the expected ones aren't found
-                job_fair_sections = soup.find_all('div', class_='content-box')
-            
+            soup = self.parse_html(response.text, parse_only=_SECTION_STRAINER)
+
+            # One traversal finds both the preferred and fallback containers
+            sections = soup.select('div.job-fair-item, div.content-box')
+            job_fair_sections = [s for s in sections if 'job-fair-item' in s.get('class', [])] or sections
+
             for section in job_fair_sections:
                 try:
                     event = self.parse_job_fair_section(section)
                     if event:
-                        events.append(event)
+                        found += 1
+                        yield event
                 except Exception as e:
                     self.logger.error(f"Error parsing job fair section: {e}", exc_info=True)
-            
+
             # If no events found using the expected structure, try to extract from the page text
-            if not events:
+            if not found:
                 self.logger.warning("No job fair sections found with expected structure, trying text extraction")
-                events.extend(self.extract_events_from_text(soup.get_text()))
-            
+                # The strained tree only holds the listing divs; reparse in
+                # full when nothing matched at all
+                text = soup.get_text() if sections else self.parse_html(response.text).get_text()
+                yield from self.extract_events_from_text(text)
+
         except Exception as e:
             self.logger.error(f"Error scraping main page: {e}", exc_info=True)
-        
-        return events
     
     def scrape_recruitment_day_page(self):
         """
         Scrape the recruitment day page.
         
-        Returns:
-            list: List of job fair events
+        Yields:
+            dict: Job fair events
         """
-        events = []
-        
+        found = 0
+
         try:
             # Get the recruitment day page
             response = self.get_page(self.urls['recruitment_day'])
-            soup = self.parse_html(response.text)
-            
-            # Find recruitment day listings
-            recruitment_day_sections = soup.find_all('div', class_='recruitment-day-item')
-            
-            if not recruitment_day_sections:
-                # Try alternative selectors if the expected ones aren't found
-                recruitment_day_sections = soup.find_all('div', class_='content-box')
-            
+            soup = self.parse_html(response.text, parse_only=_SECTION_STRAINER)
+
+            # One traversal finds both the preferred and fallback containers
+            sections = soup.select('div.recruitment-day-item, div.content-box')
+            recruitment_day_sections = [s for s in sections if 'recruitment-day-item' in s.get('class', [])] or sections
+
             for section in recruitment_day_sections:
                 try:
                     event = self.parse_recruitment_day_section(section)
                     if event:
-                        events.append(event)
+                        found += 1
+                        yield event
                 except Exception as e:
                     self.logger.error(f"Error parsing recruitment day section: {e}", exc_info=True)
-            
+
             # If no events found using the expected structure, try to extract from the page text
-            if not events:
+            if not found:
                 self.logger.warning("No recruitment day sections found with expected structure, trying text extraction")
-                events.extend(self.extract_events_from_text(soup.get_text()))
-            
+                # The strained tree only holds the listing divs; reparse in
+                # full when nothing matched at all
+                text = soup.get_text() if sections else self.parse_html(response.text).get_text()
+                yield from self.extract_events_from_text(text)
+
         except Exception as e:
             self.logger.error(f"Error scraping recruitment day page: {e}", exc_info=True)
-        
-        return events
     
     def parse_job_fair_section(self, section):
         """
@@ -165,67 +200,79 @@ class LabourDeptScraper(BaseScraper):
         if title_elem:
             event['event_name'] = title_elem.get_text().strip()
             event['event_name_zh'] = event['event_name']
-        
+
+        # Materialize the section text once; the hint regexes below scan
+        # this one string instead of BS4 walking every text node per label.
+        # Newline separators keep element boundaries visible so the
+        # [^\n]-based value patterns can't run into the next label
+        section_text = section.get_text('\n', strip=True)
+
         # Extract date and time
-        date_elem = section.find('span', class_='date') or section.find(text=re.compile(r'\d{4}年\d{1,2}月\d{1,2}日'))
-        if date_elem:
-            date_text = date_elem.get_text().strip() if hasattr(date_elem, 'get_text') else date_elem.strip()
+        date_elem = section.find('span', class_='date')
+        if date_elem is not None:
+            date_text = date_elem.get_text().strip()
+        else:
+            date_line_match = _DATE_LINE_RE.search(section_text)
+            date_text = date_line_match.group(1) if date_line_match else None
+        if date_text:
             event['start_datetime'] = normalize_datetime(date_text, source='labour_dept')
-            
+
             # Try to extract end time if available
-            time_range_match = re.search(r'(\d{1,2}:\d{2})\s*[至-]\s*(\d{1,2}:\d{2})', date_text)
+            time_range_match = _TIME_RANGE_RE.search(date_text)
             if time_range_match:
                 start_time, end_time = time_range_match.groups()
                 event['end_datetime'] = normalize_datetime(f"{date_text.split()[0]} {end_time}", source='labour_dept')
-        
+
         # Extract venue
-        venue_elem = section.find('span', class_='venue') or section.find(text=re.compile(r'地點|地址|場地'))
-        if venue_elem:
-            venue_text = venue_elem.get_text().strip() if hasattr(venue_elem, 'get_text') else venue_elem.strip()
-            venue_match = re.search(r'[：:]\s*(.+)', venue_text)
-            if venue_match:
-                venue = venue_match.group(1).strip()
-                event['venue_name'] = normalize_venue_name(venue)
-                event['venue_address'] = venue
-                event['district'] = normalize_district(venue)
-        
+        venue_elem = section.find('span', class_='venue')
+        if venue_elem is not None:
+            venue = _after_colon(venue_elem.get_text().strip())
+        else:
+            venue_match = _VENUE_VALUE_RE.search(section_text)
+            venue = venue_match.group(1).strip() if venue_match else None
+        if venue:
+            event['venue_name'] = normalize_venue_name(venue)
+            event['venue_address'] = venue
+            event['district'] = normalize_district(venue)
+
         # Extract organizer
-        organizer_elem = section.find('span', class_='organizer') or section.find(text=re.compile(r'主辦機構|舉辦機構'))
-        if organizer_elem:
-            organizer_text = organizer_elem.get_text().strip() if hasattr(organizer_elem, 'get_text') else organizer_elem.strip()
-            organizer_match = re.search(r'[：:]\s*(.+)', organizer_text)
+        organizer_elem = section.find('span', class_='organizer')
+        if organizer_elem is not None:
+            organizer = _after_colon(organizer_elem.get_text().strip())
+            if organizer:
+                event['organizer_name'] = organizer
+        else:
+            organizer_match = _ORGANIZER_VALUE_RE.search(section_text)
             if organizer_match:
                 event['organizer_name'] = organizer_match.group(1).strip()
-        else:
-            event['organizer_name'] = "香港勞工處"  # Default organizer
-        
+            else:
+                event['organizer_name'] = "香港勞工處"  # Default organizer
+
         # Extract description
         desc_elem = section.find('div', class_='description') or section.find('p')
         if desc_elem:
             event['description'] = clean_html(str(desc_elem))
             event['description_zh'] = event['description']
-        
+
         # Extract link to details page
         link_elem = section.find('a', href=True)
         if link_elem:
             event['website_link'] = self.base_url + link_elem['href'] if link_elem['href'].startswith('/') else link_elem['href']
-        
+
         # Extract contact information
-        contact_elem = section.find(text=re.compile(r'聯絡|查詢|電話|電郵'))
-        if contact_elem:
-            contact_text = contact_elem.strip() if isinstance(contact_elem, str) else contact_elem.get_text().strip()
-            contact_info = extract_contact_info(contact_text)
+        contact_match = _CONTACT_LINE_RE.search(section_text)
+        if contact_match:
+            contact_info = extract_contact_info(contact_match.group(1))
             event['contact_email'] = contact_info['email']
             event['contact_phone'] = contact_info['phone']
-        
+
         # Set default values for required fields if not found
         if 'event_name' not in event:
             return None
-        
+
         if 'start_datetime' not in event:
             # Try to find date in the text
-            text = section.get_text()
-            date_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', text)
+            date_match = _ZH_DATE_RE.search(section_text)
             if date_match:
                 year, month, day = date_match.groups()
                 event['start_datetime'] = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
@@ -266,38 +313,54 @@ class LabourDeptScraper(BaseScraper):
         Args:
             text (str): Page text
             
-        Returns:
-            list: List of events
+        Yields:
+            dict: Events found in the text
         """
-        events = []
-        
-        # Look for date patterns
-        date_matches = re.finditer(r'(\d{4})年(\d{1,2})月(\d{1,2})日', text)
-        
+        # Scan the full text once per pattern, then assign venues and
+        # times to dates by position, instead of re-running every regex
+        # over a sliced window for each date
+        date_matches = list(_ZH_DATE_RE.finditer(text))
+        if not date_matches:
+            return
+
+        venue_matches = list(_VENUE_HINT_RE.finditer(text))
+        time_matches = list(_TIME_RANGE_RE.finditer(text))
+        venue_idx = 0
+        time_idx = 0
+
         for date_match in date_matches:
             try:
                 # Extract date
                 year, month, day = date_match.groups()
                 date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                
+
                 # Find surrounding text (50 chars before and 200 chars after the date)
                 start_pos = max(0, date_match.start() - 50)
                 end_pos = min(len(text), date_match.end() + 200)
                 context = text[start_pos:end_pos]
-                
+
                 # Extract event name (look for title-like text before the date)
-                name_match = re.search(r'([^。！？\n]{5,30})[^\n]*' + re.escape(date_match.group(0)), context)
+                date_pos = date_match.start() - start_pos
+                name_match = _NAME_HINT_RE.search(context[:date_pos])
                 event_name = name_match.group(1).strip() if name_match else f"勞工處招聘活動 ({date_str})"
-                
-                # Extract venue
-                venue_match = re.search(r'地[點址場].*?[：:]\s*([^。！？\n]{3,50})', context)
-                venue = venue_match.group(1).strip() if venue_match else "待定"
-                
-                # Extract time
-                time_match = re.search(r'(\d{1,2}:\d{2})\s*[至-]\s*(\d{1,2}:\d{2})', context)
-                start_time = time_match.group(1) if time_match else "09:00"
-                end_time = time_match.group(2) if time_match else "17:00"
-                
+
+                # Extract venue: advance the pre-scanned cursor into this
+                # date's window and take the first match inside it
+                while venue_idx < len(venue_matches) and venue_matches[venue_idx].start() < start_pos:
+                    venue_idx += 1
+                if venue_idx < len(venue_matches) and venue_matches[venue_idx].start() < end_pos:
+                    venue = venue_matches[venue_idx].group(1).strip()
+                else:
+                    venue = "待定"
+
+                # Extract time the same way
+                while time_idx < len(time_matches) and time_matches[time_idx].start() < start_pos:
+                    time_idx += 1
+                if time_idx < len(time_matches) and time_matches[time_idx].start() < end_pos:
+                    start_time, end_time = time_matches[time_idx].groups()
+                else:
+                    start_time, end_time = "09:00", "17:00"
+
                 # Create event
                 event = {
                     'event_name': event_name,
@@ -317,9 +380,7 @@ class LabourDeptScraper(BaseScraper):
                     'status': 'UPCOMING'
                 }
                 
-                events.append(event)
-            
+                yield event
+
             except Exception as e:
                 self.logger.error(f"Error extracting event from text: {e}", exc_info=True)
-        
-        return events
@@ -9,8 +9,9 @@ import sys
 import time
 from datetime import datetime
 from functools import wraps
-from logging.handlers import RotatingFileHandler
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from logging.handlers import RotatingFileHandler, MemoryHandler
+import httpx
+from tenacity import AsyncRetrying, retry, stop_after_attempt, wait_exponential, retry_if_exception
 
 # Create logs directory if it doesn't exist
 logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
@@ -38,6 +39,18 @@ def setup_logger(name, log_level=logging.INFO):
         file_handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5)
         file_handler.setLevel(log_level)
         
+        # Buffer file writes so hot scraper loops don't pay a syscall
+        # per record; errors and shutdown flush the buffer immediately
+        memory_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        # flush() hands records straight to the target without re-checking
+        # its level, so the buffer itself must filter at the file's level
+        memory_handler.setLevel(log_level)
+        
         # Create a console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
@@ -48,11 +61,21 @@ def setup_logger(name, log_level=logging.INFO):
         console_handler.setFormatter(formatter)
         
         # Add the handlers to the logger
-        logger.addHandler(file_handler)
+        logger.addHandler(memory_handler)
         logger.addHandler(console_handler)
     
     return logger
 
+# Only transient failures are worth retrying; programming errors and
+# client-side HTTP errors should surface immediately instead of burning
+# max_attempts rounds of backoff first
+def _is_transient_error(exc):
+    if isinstance(exc, (ConnectionError, TimeoutError, httpx.TransportError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in (502, 503, 504)
+    return False
+
 # Create a retry decorator for web requests
 def with_retry(max_attempts=3, min_wait=1, max_wait=10):
     """
@@ -71,11 +94,7 @@ def with_retry(max_attempts=3, min_wait=1, max_wait=10):
         @retry(
             stop=stop_after_attempt(max_attempts),
             wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-            retry=retry_if_exception_type((
-                ConnectionError, 
-                TimeoutError, 
-                Exception
-            )),
+            retry=retry_if_exception(_is_transient_error),
             reraise=True
         )
         def wrapper(*args, **kwargs):
@@ -83,5 +102,25 @@ def with_retry(max_attempts=3, min_wait=1, max_wait=10):
         return wrapper
     return decorator
 
+# Async counterpart of with_retry for coroutine-based scrapers
+def async_retrying(max_attempts=3, min_wait=1, max_wait=10):
+    """
+    Build an AsyncRetrying iterator with exponential backoff.
+
+    Args:
+        max_attempts (int): Maximum number of retry attempts
+        min_wait (int): Minimum wait time in seconds
+        max_wait (int): Maximum wait time in seconds
+
+    Returns:
+        tenacity.AsyncRetrying: Retry iterator for use with `async for`
+    """
+    return AsyncRetrying(
+        stop=stop_after_attempt(max_attempts),
+        wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True
+    )
+
 # Main logger for the application
 main_logger = setup_logger('hk_job_fair_aggregator')
@@ -7,41 +7,132 @@ import re
 import uuid
 import hashlib
 import pytz
+from functools import lru_cache
 from datetime import datetime, timedelta
 from dateutil import parser
-import opencc
+import ahocorasick
+from rapidfuzz import fuzz
+from collections import defaultdict
 
-# Initialize OpenCC converter for Simplified to Traditional Chinese
-s2t_converter = opencc.OpenCC('s2t.json')
+# OpenCC loads several MB of dictionaries, so the converter is built on
+# first use rather than at import time
+@lru_cache(maxsize=None)
+def _get_s2t_converter():
+    import opencc
+    return opencc.OpenCC('s2t.json')
 
 # Hong Kong timezone
 HK_TIMEZONE = pytz.timezone('Asia/Hong_Kong')
 
+# Formats seen across the sources, tried before the slow fuzzy parse
+_FAST_DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%d/%m/%Y', '%d-%m-%Y', '%d-%b-%Y')
+_FAST_DATETIME_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y/%m/%d %H:%M',
+)
+
+# Google's RE2 matches these simple patterns without backtracking; use
+# it for the hottest ones when it happens to be installed, otherwise
+# stick with the stdlib engine
+try:
+    import re2 as _re_fast
+except ImportError:
+    _re_fast = re
+
+# Patterns used on every normalization call, compiled once at import time
+_WS_RE = _re_fast.compile(r'\s+')
+_LABOUR_DATE_RE = _re_fast.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+_LABOUR_TIME_RE = _re_fast.compile(r'(上午|下午)(\d{1,2}):(\d{2})')
+_CONTACT_INFO_RE = re.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<phone>(?:\+852\s?)?(?:\d{4}\s?\d{4}|\d{8}))'
+)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Canonical venue names, keyed by casefolded alias; checked as an exact
+# lookup first and as substrings only on miss
+_VENUE_EXACT = {
+    '香港會議展覽中心': '香港會議展覽中心',
+    'hong kong convention and exhibition centre': '香港會議展覽中心',
+    'hkcec': '香港會議展覽中心',
+    '九龍灣國際展貿中心': '九龍灣國際展貿中心',
+    'kowloonbay international trade & exhibition centre': '九龍灣國際展貿中心',
+    'kitec': '九龍灣國際展貿中心',
+}
+_VENUE_ALIASES = tuple(_VENUE_EXACT.items())
+
+# Hong Kong districts compiled into one automaton so an address is
+# scanned once regardless of how many names and aliases are registered.
+# Chinese names map to themselves, English names to the Chinese form.
+_DISTRICT_AC = ahocorasick.Automaton()
+for _chi in (
+    '中西區', '灣仔', '東區', '南區',  # Hong Kong Island
+    '油尖旺', '深水埗', '九龍城', '黃大仙', '觀塘',  # Kowloon
+    '葵青', '荃灣', '屯門', '元朗', '北區', '大埔', '沙田', '西貢', '離島'  # New Territories
+):
+    _DISTRICT_AC.add_word(_chi, _chi)
+for _eng, _chi in {
+    'Central': '中西區',
+    'Western': '中西區',
+    'Wan Chai': '灣仔',
+    'Eastern': '東區',
+    'Southern': '南區',
+    'Yau Tsim Mong': '油尖旺',
+    'Sham Shui Po': '深水埗',
+    'Kowloon City': '九龍城',
+    'Wong Tai Sin': '黃大仙',
+    'Kwun Tong': '觀塘',
+    'Kwai Tsing': '葵青',
+    'Tsuen Wan': '荃灣',
+    'Tuen Mun': '屯門',
+    'Yuen Long': '元朗',
+    'North': '北區',
+    'Tai Po': '大埔',
+    'Sha Tin': '沙田',
+    'Sai Kung': '西貢',
+    'Islands': '離島',
+}.items():
+    _DISTRICT_AC.add_word(_eng, _chi)
+_DISTRICT_AC.make_automaton()
+
 def normalize_date(date_str, source=None):
     """
     Normalize date strings to ISO format (YYYY-MM-DD).
-    
+
     Args:
         date_str (str): Date string in various formats
         source (str, optional): Source name for source-specific parsing
-        
+
     Returns:
         str: Normalized date in ISO format
     """
     if not date_str:
         return None
-    
+    return _normalize_date_cached(date_str, source)
+
+@lru_cache(maxsize=4096)
+def _normalize_date_cached(date_str, source):
     # Remove extra whitespace
-    date_str = re.sub(r'\s+', ' ', date_str.strip())
+    date_str = _WS_RE.sub(' ', date_str.strip())
     
     # Source-specific parsing
     if source == 'labour_dept':
         # Handle Labour Department date format (e.g., "2023年12月25日")
-        match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_str)
+        match = _LABOUR_DATE_RE.search(date_str)
         if match:
             year, month, day = match.groups()
-            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-    
+            return '%04d-%02d-%02d' % (int(year), int(month), int(day))
+
+    # Known formats first; strptime is roughly two orders of magnitude
+    # cheaper than a fuzzy dateutil parse
+    for fmt in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+
     # Try to parse with dateutil
     try:
         parsed_date = parser.parse(date_str, fuzzy=True)
@@ -52,31 +143,35 @@ def normalize_date(date_str, source=None):
 def normalize_datetime(datetime_str, date_str=None, time_str=None, source=None):
     """
     Normalize datetime strings to ISO format with timezone (YYYY-MM-DDTHH:MM:SS+08:00).
-    
+
     Args:
         datetime_str (str, optional): Combined datetime string
         date_str (str, optional): Date string if separate from time
         time_str (str, optional): Time string if separate from date
         source (str, optional): Source name for source-specific parsing
-        
+
     Returns:
         str: Normalized datetime in ISO format with timezone
     """
     if not any([datetime_str, (date_str and time_str)]):
         return None
-    
+
     # If date and time are provided separately, combine them
     if date_str and time_str:
         datetime_str = f"{date_str} {time_str}"
-    
+
+    return _normalize_datetime_cached(datetime_str, source)
+
+@lru_cache(maxsize=4096)
+def _normalize_datetime_cached(datetime_str, source):
     # Remove extra whitespace
-    datetime_str = re.sub(r'\s+', ' ', datetime_str.strip())
+    datetime_str = _WS_RE.sub(' ', datetime_str.strip())
     
     # Source-specific parsing
     if source == 'labour_dept':
         # Handle Labour Department datetime format (e.g., "2023年12月25日 上午10:00 - 下午5:00")
-        date_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', datetime_str)
-        time_match = re.search(r'(上午|下午)(\d{1,2}):(\d{2})', datetime_str)
+        date_match = _LABOUR_DATE_RE.search(datetime_str)
+        time_match = _LABOUR_TIME_RE.search(datetime_str)
         
         if date_match and time_match:
             year, month, day = date_match.groups()
@@ -86,9 +181,21 @@ def normalize_datetime(datetime_str, date_str=None, time_str=None, source=None):
             if am_pm == '下午' and hour < 12:
                 hour += 12
             
+            # localize attaches the HK offset to the naive datetime;
+            # astimezone would have treated it as local machine time
             dt = datetime(int(year), int(month), int(day), hour, int(minute))
-            return dt.astimezone(HK_TIMEZONE).isoformat()
-    
+            return HK_TIMEZONE.localize(dt).isoformat()
+
+    # Known formats first, falling back to the fuzzy parse on miss
+    for fmt in _FAST_DATETIME_FORMATS:
+        try:
+            parsed_dt = datetime.strptime(datetime_str, fmt)
+        except ValueError:
+            continue
+        if parsed_dt.tzinfo is None:
+            parsed_dt = HK_TIMEZONE.localize(parsed_dt)
+        return parsed_dt.isoformat()
+
     # Try to parse with dateutil
     try:
         parsed_dt = parser.parse(datetime_str, fuzzy=True)
@@ -101,6 +208,7 @@ def normalize_datetime(datetime_str, date_str=None, time_str=None, source=None):
     except (ValueError, parser.ParserError):
         return None
 
+@lru_cache(maxsize=1024)
 def normalize_venue_name(venue_name):
     """
     Normalize venue names for consistency.
@@ -115,25 +223,22 @@ def normalize_venue_name(venue_name):
         return None
     
     # Remove extra whitespace
-    venue_name = re.sub(r'\s+', ' ', venue_name.strip())
-    
-    # Common venue name mappings
-    venue_mappings = {
-        r'香港會議展覽中心': '香港會議展覽中心',
-        r'Hong Kong Convention and Exhibition Centre': '香港會議展覽中心',
-        r'HKCEC': '香港會議展覽中心',
-        r'九龍灣國際展貿中心': '九龍灣國際展貿中心',
-        r'Kowloonbay International Trade & Exhibition Centre': '九龍灣國際展貿中心',
-        r'KITEC': '九龍灣國際展貿中心',
-    }
-    
-    # Apply mappings
-    for pattern, replacement in venue_mappings.items():
-        if re.search(pattern, venue_name, re.IGNORECASE):
-            return replacement
-    
+    venue_name = _WS_RE.sub(' ', venue_name.strip())
+
+    # Exact match against the canonical table (case-insensitive)
+    folded = venue_name.casefold()
+    canonical = _VENUE_EXACT.get(folded)
+    if canonical:
+        return canonical
+
+    # Venue embedded in a longer address string
+    for alias, mapped in _VENUE_ALIASES:
+        if alias in folded:
+            return mapped
+
     return venue_name
 
+@lru_cache(maxsize=1024)
 def normalize_district(address):
     """
     Extract and normalize district from address.
@@ -146,49 +251,31 @@ def normalize_district(address):
     """
     if not address:
         return None
-    
-    # Common districts in Hong Kong
-    districts = [
-        '中西區', '灣仔', '東區', '南區',  # Hong Kong Island
-        '油尖旺', '深水埗', '九龍城', '黃大仙', '觀塘',  # Kowloon
-        '葵青', '荃灣', '屯門', '元朗', '北區', '大埔', '沙田', '西貢', '離島'  # New Territories
-    ]
-    
-    # Check if any district is in the address
-    for district in districts:
-        if district in address:
-            return district
-    
-    # English district names
-    english_districts = {
-        'Central': '中西區',
-        'Western': '中西區',
-        'Wan Chai': '灣仔',
-        'Eastern': '東區',
-        'Southern': '南區',
-        'Yau Tsim Mong': '油尖旺',
-        'Sham Shui Po': '深水埗',
-        'Kowloon City': '九龍城',
-        'Wong Tai Sin': '黃大仙',
-        'Kwun Tong': '觀塘',
-        'Kwai Tsing': '葵青',
-        'Tsuen Wan': '荃灣',
-        'Tuen Mun': '屯門',
-        'Yuen Long': '元朗',
-        'North': '北區',
-        'Tai Po': '大埔',
-        'Sha Tin': '沙田',
-        'Sai Kung': '西貢',
-        'Islands': '離島'
-    }
-    
-    # Check English district names
-    for eng, chi in english_districts.items():
-        if eng in address:
-            return chi
-    
+
+    # Single pass over the address; the first hit wins
+    for _, district in _DISTRICT_AC.iter(address):
+        return district
+
     return None
 
+def has_cjk(text):
+    """
+    Check whether text contains any CJK (Chinese) characters.
+
+    Scans with early exit, which beats a regex match for the short
+    strings this is typically called on.
+
+    Args:
+        text (str): Input text
+
+    Returns:
+        bool: True if any CJK character is present
+    """
+    if not text:
+        return False
+
+    return any('\u4e00' <= ch <= '\u9fff' for ch in text)
+
 def normalize_language(text):
     """
     Detect and normalize language of text.
@@ -201,22 +288,26 @@ def normalize_language(text):
     """
     if not text:
         return None
-    
-    # Count Chinese characters
-    chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
-    
-    # Count English characters
-    english_chars = len(re.findall(r'[a-zA-Z]', text))
-    
-    # Determine language based on character counts
-    if chinese_chars > 0 and english_chars == 0:
+
+    # Single scan; only presence matters, so stop as soon as both
+    # scripts have been seen
+    has_chinese = has_english = False
+    for ch in text:
+        code = ord(ch)
+        if 0x4e00 <= code <= 0x9fff:
+            has_chinese = True
+        elif 0x41 <= code <= 0x5a or 0x61 <= code <= 0x7a:
+            has_english = True
+        else:
+            continue
+        if has_chinese and has_english:
+            return 'BOTH'
+
+    if has_chinese:
         return 'ZH-HK'
-    elif chinese_chars == 0 and english_chars > 0:
+    if has_english:
         return 'EN'
-    elif chinese_chars > 0 and english_chars > 0:
-        return 'BOTH'
-    else:
-        return None
+    return None
 
 def simplified_to_traditional(text):
     """
@@ -230,8 +321,36 @@ def simplified_to_traditional(text):
     """
     if not text:
         return None
-    
-    return s2t_converter.convert(text)
+
+    # Long strings (whole descriptions or pages) would crowd the cache
+    # for little hit rate, so only short repetitive values are cached
+    if len(text) > 256:
+        return _get_s2t_converter().convert(text)
+
+    return _s2t_cached(text)
+
+@lru_cache(maxsize=8192)
+def _s2t_cached(text):
+    return _get_s2t_converter().convert(text)
+
+def simplified_to_traditional_many(texts):
+    """
+    Convert a batch of Simplified Chinese strings in one OpenCC call.
+
+    Joining the inputs with a record separator and converting once
+    amortizes the converter's per-call overhead into a single pass.
+
+    Args:
+        texts (list): Strings in Simplified Chinese (None items allowed)
+
+    Returns:
+        list: Converted strings, in the same order
+    """
+    if not texts:
+        return []
+
+    joined = '\x1e'.join(t or '' for t in texts)
+    return _get_s2t_converter().convert(joined).split('\x1e')
 
 def extract_contact_info(text):
     """
@@ -245,15 +364,18 @@ def extract_contact_info(text):
     """
     if not text:
         return {'email': None, 'phone': None}
-    
-    # Extract email
-    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-    email = email_match.group(0) if email_match else None
-    
-    # Extract Hong Kong phone number
-    phone_match = re.search(r'(?:\+852\s?)?(?:\d{4}\s?\d{4}|\d{8})', text)
-    phone = phone_match.group(0) if phone_match else None
-    
+
+    # One combined scan picks up the first email and the first Hong
+    # Kong phone number, stopping once both are found
+    email = phone = None
+    for match in _CONTACT_INFO_RE.finditer(text):
+        if email is None and match.group('email'):
+            email = match.group('email')
+        elif phone is None and match.group('phone'):
+            phone = match.group('phone')
+        if email and phone:
+            break
+
     return {'email': email, 'phone': phone}
 
 def clean_html(html_text):
@@ -268,12 +390,17 @@ def clean_html(html_text):
     """
     if not html_text:
         return None
-    
+
+    # Most extracted fields are already plain text; skip the tag strip
+    # unless there is at least a '<' to look at
+    if '<' not in html_text:
+        return _WS_RE.sub(' ', html_text).strip()
+
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', html_text)
+    text = _HTML_TAG_RE.sub(' ', html_text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     
     return text
 
@@ -287,71 +414,119 @@ def generate_event_id(event_data):
     Returns:
         str: UUID for the event
     """
-    # Create a composite key from event attributes
-    key_parts = [
-        event_data.get('event_name', ''),
-        event_data.get('start_datetime', ''),
-        event_data.get('venue_name', ''),
-        event_data.get('organizer_name', '')
-    ]
-    
-    # Join parts and create a hash
-    key = '|'.join([str(part).lower() for part in key_parts if part])
-    hash_obj = hashlib.md5(key.encode())
-    
-    # Create a UUID based on the hash
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, hash_obj.hexdigest()))
+    # The dedup paths hash the same dicts repeatedly, so the computed
+    # ID is memoized on the event; savers strip it before writing
+    event_id = event_data.get('_event_id')
+    if event_id:
+        return event_id
+
+    # Create a composite key from event attributes, feeding the join
+    # directly so no intermediate lists are built
+    key = '|'.join(
+        str(part).lower()
+        for part in (
+            event_data.get('event_name'),
+            event_data.get('start_datetime'),
+            event_data.get('venue_name'),
+            event_data.get('organizer_name'),
+        )
+        if part
+    )
+
+    # Hash once; the 128-bit digest is the UUID
+    digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    event_id = str(uuid.UUID(bytes=digest))
+    event_data['_event_id'] = event_id
+    return event_id
 
-def is_duplicate_event(event, existing_events, threshold=0.85):
+def build_event_index(events):
+    """
+    Build an event-ID index for duplicate detection.
+
+    Computing the IDs once up front lets is_duplicate_event answer the
+    exact-match check with a dict lookup instead of re-hashing every
+    existing event per candidate.
+
+    Args:
+        events (list): Event data dictionaries
+
+    Returns:
+        dict: Mapping of event ID to event
+    """
+    return {generate_event_id(event): event for event in events}
+
+def build_event_buckets(existing_index):
+    """
+    Bucket indexed events by (venue, date) for the fuzzy pass.
+
+    A fuzzy match requires the same venue and a date within one day, so
+    grouping up front limits each candidate to a few small buckets
+    instead of a scan over every existing event.
+
+    Args:
+        existing_index (dict): Event-ID index from build_event_index
+
+    Returns:
+        dict: Mapping of (venue, date) to lists of events
+    """
+    buckets = defaultdict(list)
+    for existing in existing_index.values():
+        venue = existing.get('venue_name', '').lower()
+        date = existing.get('start_datetime', '')[:10]
+        buckets[(venue, date)].append(existing)
+    return buckets
+
+def is_duplicate_event(event, existing_index, existing_buckets=None, threshold=0.85):
     """
     Check if an event is a duplicate of any existing event.
     
     Args:
         event (dict): Event data
-        existing_events (list): List of existing events
+        existing_index (dict): Event-ID index from build_event_index
+        existing_buckets (dict): Optional (venue, date) buckets from
+            build_event_buckets; built on the fly when not supplied
         threshold (float): Similarity threshold (0.0 to 1.0)
         
     Returns:
         tuple: (is_duplicate, matching_event)
     """
-    # Generate event ID
-    event_id = generate_event_id(event)
-    
     # Check for exact ID match
-    for existing in existing_events:
-        existing_id = generate_event_id(existing)
-        if event_id == existing_id:
-            return True, existing
+    event_id = generate_event_id(event)
+    existing = existing_index.get(event_id)
+    if existing is not None:
+        return True, existing
     
     # Check for fuzzy matches
     event_name = event.get('event_name', '').lower()
     event_date = event.get('start_datetime', '')[:10]  # YYYY-MM-DD
     event_venue = event.get('venue_name', '').lower()
-    
-    for existing in existing_events:
+
+    if existing_buckets is None:
+        existing_buckets = build_event_buckets(existing_index)
+
+    # Only the same-venue buckets within one day can produce a match,
+    # plus the undated bucket, which was never date-filtered
+    try:
+        event_date_obj = datetime.fromisoformat(event_date) if event_date else None
+    except ValueError:
+        event_date_obj = None
+
+    if event_date_obj is not None:
+        candidates = []
+        for offset in (-1, 0, 1):
+            day = (event_date_obj + timedelta(days=offset)).strftime('%Y-%m-%d')
+            candidates.extend(existing_buckets.get((event_venue, day), ()))
+        candidates.extend(existing_buckets.get((event_venue, ''), ()))
+    else:
+        candidates = existing_index.values()
+
+    for existing in candidates:
         existing_name = existing.get('event_name', '').lower()
-        existing_date = existing.get('start_datetime', '')[:10]
         existing_venue = existing.get('venue_name', '').lower()
         
-        # Skip if dates are more than 1 day apart
-        if event_date and existing_date:
-            try:
-                event_date_obj = datetime.fromisoformat(event_date)
-                existing_date_obj = datetime.fromisoformat(existing_date)
-                date_diff = abs((event_date_obj - existing_date_obj).days)
-                if date_diff > 1:
-                    continue
-            except ValueError:
-                pass
-        
-        # Check name similarity
-        if event_name and existing_name:
-            # Simple similarity check (can be improved with more sophisticated algorithms)
-            shorter = min(len(event_name), len(existing_name))
-            similarity = sum(c1 == c2 for c1, c2 in zip(event_name[:shorter], existing_name[:shorter])) / shorter
-            
-            # If name and venue are similar, consider it a duplicate
-            if similarity >= threshold and event_venue == existing_venue:
+        # If name and venue are similar, consider it a duplicate
+        if event_name and existing_name and event_venue == existing_venue:
+            if fuzz.ratio(event_name, existing_name, score_cutoff=threshold * 100) >= threshold * 100:
                 return True, existing
     
     return False, None